@@ -731,6 +731,20 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
         default=True
     )
 
+    # This option is not displayed in UI, it is meant to be used from scripts.
+    # It only applies to the call that sets it: it is neither remembered by the operator, nor in export settings
+    # saved in the scene (its name doesn't start with 'export_')
+    parallel_export_callbacks: BoolProperty(
+        name='Parallel Export Callbacks',
+        description=(
+            "Run pre and post export callbacks of add-ons concurrently on worker threads. "
+            "Only use it if all callbacks are thread safe and do not access Blender data, "
+            "e.g. callbacks uploading the exported files"
+        ),
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
     will_save_settings: BoolProperty(
         name='Remember Export Settings',
         description='Store glTF export settings in the Blender project',
@@ -945,6 +959,8 @@ class ExportGLTF2_Base(ConvertGLTF2_Base):
 
             export_settings['gltf_gltfpack_noq'] = self.export_gltfpack_noq
 
+        export_settings['gltf_parallel_callbacks'] = self.parallel_export_callbacks
+
         export_settings['gltf_binary'] = bytearray()
         export_settings['gltf_binaryfilename'] = (
             path_to_uri(os.path.splitext(os.path.basename(self.filepath))[0] + '.bin')
@@ -12,15 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import bpy
-import sys
 import traceback
 
-from ...io.com.gltf2_io_debug import print_console, print_newline
+from ...io.com.gltf2_io_debug import print_console, print_newline, progress_update
 from ...io.exp import gltf2_io_export
 from ...io.exp import gltf2_io_draco_compression_extension
 from ...io.exp.gltf2_io_user_extensions import export_user_extensions
@@ -28,6 +29,30 @@ from ..com import gltf2_blender_json
 from . import gltf2_blender_gather
 from .gltf2_blender_gltf2_exporter import GlTF2Exporter
 
+# Number of files written concurrently
+IO_WORKERS = 4
+
+# Export settings used to build gltfpack options
+GLTFPACK_SETTINGS = (
+    'gltf_gltfpack_tc',
+    'gltf_gltfpack_tq',
+    'gltf_gltfpack_si',
+    'gltf_gltfpack_sa',
+    'gltf_gltfpack_slb',
+    'gltf_gltfpack_vp',
+    'gltf_gltfpack_vt',
+    'gltf_gltfpack_vn',
+    'gltf_gltfpack_vc',
+    'gltf_gltfpack_vpi',
+    'gltf_gltfpack_noq',
+)
+
+GLTFPACK_VERTEX_POSITION_OPTIONS = {
+    "Integer": "-vpi",
+    "Normalized": "-vpn",
+    "Floating-point": "-vpf",
+}
+
 
 def save(context, export_settings):
     """Start the glTF 2.0 export and saves to content either to a .gltf or .glb file."""
@@ -35,52 +60,79 @@ def save(context, export_settings):
         if bpy.context.active_object.mode != "OBJECT": # For linked object, you can't force OBJECT mode
             bpy.ops.object.mode_set(mode='OBJECT')
 
+    # frame_set re-evaluates the whole depsgraph, so avoid it when the scene is already at frame 0
     original_frame = bpy.context.scene.frame_current
-    if not export_settings['gltf_current_frame']:
+    change_frame = not export_settings['gltf_current_frame'] \
+        and (original_frame != 0 or bpy.context.scene.frame_subframe != 0.0)
+    if change_frame:
         bpy.context.scene.frame_set(0)
 
     __notify_start(context)
     start_time = time.time()
-    pre_export_callbacks = export_settings["pre_export_callbacks"]
-    for callback in pre_export_callbacks:
-        callback(export_settings)
+    __run_callbacks(export_settings["pre_export_callbacks"], export_settings)
+
+    # The .bin file and images are written on worker threads, concurrently with each other
+    # and with the json, that is built on main thread
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as io_executor:
+        json, buffer, pending_writes = __export(export_settings, io_executor)
+
+        # Post export callbacks may read these files: they must be complete before callbacks run
+        for pending_write in pending_writes:
+            pending_write.result()
+
+    __run_callbacks(export_settings["post_export_callbacks"], export_settings)
+    gltfpack_process = __write_file(json, buffer, export_settings)
 
-    json, buffer = __export(export_settings)
+    # gltfpack runs in its own process, restore the scene while it is working
+    if change_frame:
+        bpy.context.scene.frame_set(int(original_frame))
 
-    post_export_callbacks = export_settings["post_export_callbacks"]
-    for callback in post_export_callbacks:
-        callback(export_settings)
-    __write_file(json, buffer, export_settings)
+    if gltfpack_process is not None:
+        __wait_for_gltfpack(gltfpack_process)
 
     end_time = time.time()
     __notify_end(context, end_time - start_time)
 
-    if not export_settings['gltf_current_frame']:
-        bpy.context.scene.frame_set(int(original_frame))
     return {'FINISHED'}
 
 
-def __export(export_settings):
+def __export(export_settings, io_executor):
     exporter = GlTF2Exporter(export_settings)
     __gather_gltf(exporter, export_settings)
-    buffer = __create_buffer(exporter, export_settings)
-    exporter.finalize_images()
+    buffer, buffer_write = __create_buffer(exporter, export_settings, io_executor)
+    pending_writes = exporter.finalize_images(executor=io_executor)
+    if buffer_write is not None:
+        pending_writes.append(buffer_write)
 
     export_user_extensions('gather_gltf_extensions_hook', export_settings, exporter.glTF)
     exporter.traverse_extensions()
 
-    # now that addons possibly add some fields in json, we can fix in needed
-    json = __fix_json(exporter.glTF.to_dict())
+    # now that addons possibly add some fields in json, we can convert it
+    # None values and empty collections are skipped while building the dict
+    json = exporter.glTF.to_dict()
 
-    return json, buffer
+    return json, buffer, pending_writes
+
+
+def __run_callbacks(callbacks, export_settings):
+    # Callbacks run concurrently only on demand (see parallel_export_callbacks option)
+    if export_settings['gltf_parallel_callbacks'] and len(callbacks) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(callbacks))) as executor:
+            for future in [executor.submit(callback, export_settings) for callback in callbacks]:
+                future.result()
+    else:
+        for callback in callbacks:
+            callback(export_settings)
 
 
 def __gather_gltf(exporter, export_settings):
     active_scene_idx, scenes, animations = gltf2_blender_gather.gather_gltf2(export_settings)
 
-    unused_skins = export_settings['vtree'].get_unused_skins()
+    # Unused skins are only looked for when skins are exported
+    unused_skins = export_settings['vtree'].get_unused_skins() if export_settings['gltf_skins'] else []
 
-    if export_settings['gltf_draco_mesh_compression']:
+    draco_mesh_compression = export_settings['gltf_draco_mesh_compression']
+    if draco_mesh_compression:
         gltf2_io_draco_compression_extension.encode_scene_primitives(scenes, export_settings)
         exporter.add_draco_extension()
 
@@ -90,58 +142,26 @@ def __gather_gltf(exporter, export_settings):
         exporter.add_scene(scene, idx==active_scene_idx)
     for animation in animations:
         exporter.add_animation(animation)
-    exporter.traverse_unused_skins(unused_skins)
+    if unused_skins:
+        exporter.traverse_unused_skins(unused_skins)
 
 
-def __create_buffer(exporter, export_settings):
-    buffer = bytes()
+def __create_buffer(exporter, export_settings, io_executor):
+    # Only GLB files embed the binary data in the written file: buffer stays None otherwise
+    buffer = None
+    buffer_write = None
     if export_settings['gltf_format'] == 'GLB':
         buffer = exporter.finalize_buffer(export_settings['gltf_filedirectory'], is_glb=True)
     else:
         if export_settings['gltf_format'] == 'GLTF_EMBEDDED':
             exporter.finalize_buffer(export_settings['gltf_filedirectory'])
         else:
-            exporter.finalize_buffer(export_settings['gltf_filedirectory'],
-                                     export_settings['gltf_binaryfilename'])
-
-    return buffer
-
-
-def __fix_json(obj):
-    # TODO: move to custom JSON encoder
-    fixed = obj
-    if isinstance(obj, dict):
-        fixed = {}
-        for key, value in obj.items():
-            if key == 'extras' and value is not None:
-                fixed[key] = value
-                continue
-            if not __should_include_json_value(key, value):
-                continue
-            fixed[key] = __fix_json(value)
-    elif isinstance(obj, list):
-        fixed = []
-        for value in obj:
-            fixed.append(__fix_json(value))
-    elif isinstance(obj, float):
-        # force floats to int, if they are integers (prevent INTEGER_WRITTEN_AS_FLOAT validator warnings)
-        if int(obj) == obj:
-            return int(obj)
-    return fixed
-
-
-def __should_include_json_value(key, value):
-    allowed_empty_collections = ["KHR_materials_unlit"]
-
-    if value is None:
-        return False
-    elif __is_empty_collection(value) and key not in allowed_empty_collections:
-        return False
-    return True
-
-
-def __is_empty_collection(value):
-    return (isinstance(value, dict) or isinstance(value, list)) and len(value) == 0
+            buffer_write = exporter.finalize_buffer(export_settings['gltf_filedirectory'],
+                                                    export_settings['gltf_binaryfilename'],
+                                                    executor=io_executor)
+
+    return buffer, buffer_write
+
 
 def __postprocess_with_gltfpack(export_settings):
 
@@ -149,64 +169,66 @@ def __postprocess_with_gltfpack(export_settings):
     gltfpack_binary_file_path = os.path.join(gltfpack_path, "gltfpack")
 
     gltf_file_path = export_settings['gltf_filepath']
-    gltf_file_base = os.path.splitext(os.path.basename(gltf_file_path))[0]
-    gltf_file_extension = os.path.splitext(os.path.basename(gltf_file_path))[1]
-    gltf_file_directory = os.path.dirname(gltf_file_path)
-    gltf_output_file_directory = os.path.join(gltf_file_directory, "gltfpacked")
-    if (os.path.exists(gltf_output_file_directory) is False):
-        os.makedirs(gltf_output_file_directory)
+    gltf_output_file_directory = os.path.join(os.path.dirname(gltf_file_path), "gltfpacked")
+    os.makedirs(gltf_output_file_directory, exist_ok=True)
 
     gltf_input_file_path = gltf_file_path
-    gltf_output_file_path = os.path.join(gltf_output_file_directory, gltf_file_base + gltf_file_extension)
-
-    options = []
-
-    if (export_settings['gltf_gltfpack_tc']):
-        options.append("-tc")
-    
-    options.append("-tq")
-    options.append(f"{export_settings['gltf_gltfpack_tq']}")
-
-    options.append("-si")
-    options.append(f"{export_settings['gltf_gltfpack_si']}")
-
-    if (export_settings['gltf_gltfpack_sa']):
-        options.append("-sa")
-
-    if (export_settings['gltf_gltfpack_slb']):
-        options.append("-slb")
-
-    options.append("-vp")
-    options.append(f"{export_settings['gltf_gltfpack_vp']}")
-    options.append("-vt")
-    options.append(f"{export_settings['gltf_gltfpack_vt']}")
-    options.append("-vn")
-    options.append(f"{export_settings['gltf_gltfpack_vn']}")
-    options.append("-vc")
-    options.append(f"{export_settings['gltf_gltfpack_vc']}")
-    
-    match export_settings['gltf_gltfpack_vpi']:
-        case "Integer":
-            options.append("-vpi")
-        case "Normalized":
-            options.append("-vpn")
-        case "Floating-point":
-            options.append("-vpf")
-
-    if (export_settings['gltf_gltfpack_noq']):
-        options.append("-noq")
-
-    parameters = []
-    parameters.append("-i")
-    parameters.append(gltf_input_file_path)
-    parameters.append("-o")
-    parameters.append(gltf_output_file_path)
-
-    try:
-        subprocess.run([gltfpack_binary_file_path] + options + parameters, check=True)
-    except subprocess.CalledProcessError as e:
+    gltf_output_file_path = os.path.join(gltf_output_file_directory, os.path.basename(gltf_file_path))
+
+    # Options only depend on gltfpack settings, that are usually the same between successive exports
+    options = list(__gltfpack_options(tuple(export_settings[key] for key in GLTFPACK_SETTINGS)))
+
+    parameters = ["-i", gltf_input_file_path, "-o", gltf_output_file_path]
+
+    # The user is waiting for gltfpack: let it use all cores (including for basisu texture encoding)
+    cpu_count = os.cpu_count() or 1
+    env = {"OMP_NUM_THREADS": str(cpu_count), **os.environ}
+    creationflags = getattr(subprocess, 'ABOVE_NORMAL_PRIORITY_CLASS', 0)  # Windows only
+
+    process = subprocess.Popen([gltfpack_binary_file_path] + options + parameters, env=env, creationflags=creationflags)
+    __boost_gltfpack_process(process.pid, cpu_count)
+    return process
+
+
+def __boost_gltfpack_process(pid, cpu_count):
+    # Done from the parent process, as preexec_fn is not safe while other threads are running.
+    # Both are only hints: raising priority needs privileges, and cpus can be restricted by cgroups
+    if hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(pid, range(cpu_count))
+        except OSError:
+            pass
+    if hasattr(os, 'setpriority'):
+        try:
+            os.setpriority(os.PRIO_PROCESS, pid, -5)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=8)
+def __gltfpack_options(gltfpack_settings):
+    s = dict(zip(GLTFPACK_SETTINGS, gltfpack_settings))
+    return (
+        *(("-tc",) if s['gltf_gltfpack_tc'] else ()),
+        "-tq", f"{s['gltf_gltfpack_tq']}",
+        "-si", f"{s['gltf_gltfpack_si']}",
+        *(("-sa",) if s['gltf_gltfpack_sa'] else ()),
+        *(("-slb",) if s['gltf_gltfpack_slb'] else ()),
+        "-vp", f"{s['gltf_gltfpack_vp']}",
+        "-vt", f"{s['gltf_gltfpack_vt']}",
+        "-vn", f"{s['gltf_gltfpack_vn']}",
+        "-vc", f"{s['gltf_gltfpack_vc']}",
+        *((GLTFPACK_VERTEX_POSITION_OPTIONS[s['gltf_gltfpack_vpi']],)
+          if s['gltf_gltfpack_vpi'] in GLTFPACK_VERTEX_POSITION_OPTIONS else ()),
+        *(("-noq",) if s['gltf_gltfpack_noq'] else ()),
+    )
+
+
+def __wait_for_gltfpack(process):
+    if process.wait() != 0:
         print_console('ERROR', "Calling gltfpack was not successful")
 
+
 def __write_file(json, buffer, export_settings):
     try:
         gltf2_io_export.save_gltf(
@@ -215,26 +237,23 @@ def __write_file(json, buffer, export_settings):
             gltf2_blender_json.BlenderJSONEncoder,
             buffer)
         if (export_settings['gltf_use_gltfpack'] == True):
-            __postprocess_with_gltfpack(export_settings)
-        
+            return __postprocess_with_gltfpack(export_settings)
+        return None
+
     except AssertionError as e:
-        _, _, tb = sys.exc_info()
-        traceback.print_tb(tb)  # Fixed format
-        tb_info = traceback.extract_tb(tb)
-        for tbi in tb_info:
-            filename, line, func, text = tbi
-            print_console('ERROR', 'An error occurred on line {} in statement {}'.format(line, text))
-        print_console('ERROR', str(e))
+        # Single message, so that the whole traceback is printed at once in the console
+        print_console('ERROR', ''.join(traceback.format_exception(type(e), e, e.__traceback__)))
         raise e
 
 
 def __notify_start(context):
     print_console('INFO', 'Starting glTF 2.0 export')
     context.window_manager.progress_begin(0, 100)
-    context.window_manager.progress_update(0)
+    progress_update(context.window_manager, 0, force=True)
 
 
 def __notify_end(context, elapsed):
     print_console('INFO', 'Finished glTF 2.0 export in {} s'.format(elapsed))
+    progress_update(context.window_manager, 100, force=True)
     context.window_manager.progress_end()
     print_newline()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import math
+
 from ...io.com import gltf2_io
 from ...io.com import gltf2_io_constants
 from ...io.exp import gltf2_io_binary_data
@@ -32,10 +34,21 @@ def gather_accessor(buffer_view: gltf2_io_binary_data.BinaryData,
         count=count,
         extensions=None,
         extras=None,
-        max=list(max) if max is not None else None,
-        min=list(min) if min is not None else None,
+        max=fix_min_max(max) if max is not None else None,
+        min=fix_min_max(min) if min is not None else None,
         name=None,
         normalized=None,
         sparse=None,
         type=type
     )
+
+
+def fix_min_max(values):
+    """Write whole number min/max values as int, to prevent INTEGER_WRITTEN_AS_FLOAT validator warnings."""
+    # min/max have at most 16 values: a plain loop is faster than numpy here.
+    # Values above 2**53 can't be represented exactly as integers by JSON readers using doubles
+    fixed = []
+    for v in values:
+        v = float(v)
+        fixed.append(int(v) if math.isfinite(v) and v.is_integer() and abs(v) <= 2**53 else v)
+    return fixed
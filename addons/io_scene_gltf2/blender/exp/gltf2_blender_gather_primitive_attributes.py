@@ -17,6 +17,7 @@ import numpy as np
 from ...io.com import gltf2_io, gltf2_io_constants, gltf2_io_debug
 from ...io.exp import gltf2_io_binary_data
 from ...io.exp.gltf2_io_user_extensions import export_user_extensions
+from .gltf2_blender_gather_accessors import fix_min_max
 
 
 def gather_primitive_attributes(blender_primitive, export_settings):
@@ -50,8 +51,8 @@ def array_to_accessor(array, component_type, data_type, include_max_and_min=Fals
     amax = None
     amin = None
     if include_max_and_min:
-        amax = np.amax(array, axis=0).tolist()
-        amin = np.amin(array, axis=0).tolist()
+        amax = fix_min_max(np.amax(array, axis=0).tolist())
+        amin = fix_min_max(np.amin(array, axis=0).tolist())
 
     return gltf2_io.Accessor(
         buffer_view=gltf2_io_binary_data.BinaryData(array.tobytes(), gltf2_io_constants.BufferViewTarget.ARRAY_BUFFER),
@@ -112,17 +112,28 @@ class GlTF2Exporter:
             raise RuntimeError("glTF requested, but buffers are not finalized yet")
         return self.__gltf
 
-    def finalize_buffer(self, output_path=None, buffer_name=None, is_glb=False):
-        """Finalize the glTF and write buffers."""
+    def finalize_buffer(self, output_path=None, buffer_name=None, is_glb=False, executor=None):
+        """
+        Finalize the glTF and write buffers.
+
+        If an executor is given, the buffer file is written on it, and the future of this write is returned.
+        It must be waited for before the buffer file is used, e.g. by post export callbacks.
+        """
         if self.__finalized:
             raise RuntimeError("Tried to finalize buffers for finalized glTF file")
 
+        buffer_write = None
         if self.__buffer.byte_length > 0:
             if is_glb:
                 uri = None
             elif output_path and buffer_name:
-                with open(output_path + uri_to_path(buffer_name), 'wb') as f:
-                    f.write(self.__buffer.to_bytes())
+                buffer_path = output_path + uri_to_path(buffer_name)
+                # Write a snapshot of the chunks: views can still be added by extensions traversal
+                # while the file is written on the executor
+                if executor is not None:
+                    buffer_write = executor.submit(self.__write_buffer, buffer_path, self.__buffer.to_chunks())
+                else:
+                    self.__write_buffer(buffer_path, self.__buffer.to_chunks())
                 uri = buffer_name
             else:
                 uri = self.__buffer.to_embed_string()
@@ -139,7 +150,14 @@ class GlTF2Exporter:
         self.__finalized = True
 
         if is_glb:
-            return self.__buffer.to_bytes()
+            return self.__buffer.to_chunks()
+        return buffer_write
+
+    @staticmethod
+    def __write_buffer(path, chunks):
+        with open(path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
 
     def add_draco_extension(self):
         """
@@ -150,19 +168,31 @@ class GlTF2Exporter:
         self.__gltf.extensions_required.append('KHR_draco_mesh_compression')
         self.__gltf.extensions_used.append('KHR_draco_mesh_compression')
 
-    def finalize_images(self):
+    def finalize_images(self, executor=None):
         """
         Write all images.
+
+        If an executor is given, images are written on it, and the futures of these writes are returned.
+        They must be waited for before the image files are used, e.g. by post export callbacks.
         """
         output_path = self.export_settings['gltf_texturedirectory']
 
         if self.__images:
             os.makedirs(output_path, exist_ok=True)
 
+        image_writes = []
         for name, image in self.__images.items():
             dst_path = output_path + "/" + name + image.file_extension
-            with open(dst_path, 'wb') as f:
-                f.write(image.data)
+            if executor is not None:
+                image_writes.append(executor.submit(self.__write_image, dst_path, image))
+            else:
+                self.__write_image(dst_path, image)
+        return image_writes
+
+    @staticmethod
+    def __write_image(path, image):
+        with open(path, 'wb') as f:
+            f.write(image.data)
 
     def add_scene(self, scene: gltf2_io.Scene, active: bool = False):
         """
@@ -91,19 +91,44 @@ def to_float(x):
     return x
 
 
-def extension_to_dict(obj):
+def to_number(x):
+    assert isinstance(x, (float, int)) and not isinstance(x, bool)
+    return x
+
+
+# Empty collections are not written to JSON, except for these keys
+ALLOWED_EMPTY_COLLECTIONS = frozenset(["KHR_materials_unlit"])
+
+
+def prune_dict(result):
+    """Remove None values and empty collections from a dict, while it is built for JSON export."""
+    # Runs on every exported object: the test is kept inline, without a function call per value
+    removed = [k for (k, v) in result.items()
+               if v is None
+               or (k != 'extras' and isinstance(v, (dict, list)) and not v and k not in ALLOWED_EMPTY_COLLECTIONS)]
+    for key in removed:
+        del result[key]
+    return result
+
+
+def extension_to_dict(obj, prune=False):
     if hasattr(obj, 'to_list'):
         obj = obj.to_list()
     if hasattr(obj, 'to_dict'):
         obj = obj.to_dict()
     if isinstance(obj, list):
-        return [extension_to_dict(x) for x in obj]
+        return [extension_to_dict(x, prune) for x in obj]
     elif isinstance(obj, dict):
-        return {k: extension_to_dict(v) for (k, v) in obj.items()}
+        if not prune:
+            return {k: extension_to_dict(v) for (k, v) in obj.items()}
+        # Entries are pruned before their values are converted: an extension whose values are all None
+        # is still written as {}, as its name is already listed in extensionsUsed.
+        # A copy is pruned, not to modify the user data. extras are user data, they are kept as is.
+        return {k: extension_to_dict(v, k != 'extras') for (k, v) in prune_dict(dict(obj)).items()}
     return obj
 
 def from_extension(x):
-    x = extension_to_dict(x)
+    x = extension_to_dict(x, prune=True)
     assert isinstance(x, dict)
     return x
 
@@ -143,7 +168,7 @@ class AccessorSparseIndices:
         result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
                                           self.extensions)
         result["extras"] = from_extra(self.extras)
-        return result
+        return prune_dict(result)
 
 
 class AccessorSparseValues:
@@ -178,7 +203,7 @@ class AccessorSparseValues:
         result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
                                           self.extensions)
         result["extras"] = from_extra(self.extras)
-        return result
+        return prune_dict(result)
 
 
 class AccessorSparse:
@@ -210,7 +235,7 @@ class AccessorSparse:
         result["extras"] = from_extra(self.extras)
         result["indices"] = to_class(AccessorSparseIndices, self.indices)
         result["values"] = to_class(AccessorSparseValues, self.values)
-        return result
+        return prune_dict(result)
 
 
 class Accessor:
@@ -262,13 +287,13 @@ class Accessor:
         result["extensions"] = from_union([lambda x: from_dict(from_extension, x), from_none],
                                           self.extensions)
         result["extras"] = from_extra(self.extras)
-        result["max"] = from_union([lambda x: from_list(to_float, x), from_none], self.max)
-        result["min"] = from_union([lambda x: from_list(to_float, x), from_none], self.min)
+        result["max"] = from_union([lambda x: from_list(to_number, x), from_none], self.max)
+        result["min"] = from_union([lambda x: from_list(to_number, x), from_none], self.min)
         result["name"] = from_union([from_str, from_none], self.name)
         result["normalized"] = from_union([from_bool, from_none], self.normalized)
         result["sparse"] = from_union([lambda x: to_class(AccessorSparse, x), from_none], self.sparse)
         result["type"] = from_str(self.type)
-        return result
+        return prune_dict(result)
 
 
 class AnimationChannelTarget:
@@ -300,7 +325,7 @@ class AnimationChannelTarget:
         result["extras"] = from_extra(self.extras)
         result["node"] = from_union([from_int, from_none], self.node)
         result["path"] = from_str(self.path)
-        return result
+        return prune_dict(result)
 
 
 class AnimationChannel:
@@ -329,7 +354,7 @@ class AnimationChannel:
         result["extras"] = from_extra(self.extras)
         result["sampler"] = from_int(self.sampler)
         result["target"] = to_class(AnimationChannelTarget, self.target)
-        return result
+        return prune_dict(result)
 
 
 class AnimationSampler:
@@ -363,7 +388,7 @@ class AnimationSampler:
         result["input"] = from_int(self.input)
         result["interpolation"] = from_union([from_str, from_none], self.interpolation)
         result["output"] = from_int(self.output)
-        return result
+        return prune_dict(result)
 
 
 class Animation:
@@ -395,7 +420,7 @@ class Animation:
         result["extras"] = from_extra(self.extras)
         result["name"] = from_union([from_str, from_none], self.name)
         result["samplers"] = from_list(lambda x: to_class(AnimationSampler, x), self.samplers)
-        return result
+        return prune_dict(result)
 
 
 class Asset:
@@ -430,7 +455,7 @@ class Asset:
         result["generator"] = from_union([from_str, from_none], self.generator)
         result["minVersion"] = from_union([from_str, from_none], self.min_version)
         result["version"] = from_str(self.version)
-        return result
+        return prune_dict(result)
 
 
 class BufferView:
@@ -471,7 +496,7 @@ class BufferView:
         result["extras"] = from_extra(self.extras)
         result["name"] = from_union([from_str, from_none], self.name)
         result["target"] = from_union([from_int, from_none], self.target)
-        return result
+        return prune_dict(result)
 
 
 class Buffer:
@@ -503,7 +528,7 @@ class Buffer:
         result["extras"] = from_extra(self.extras)
         result["name"] = from_union([from_str, from_none], self.name)
         result["uri"] = from_union([from_str, from_none], self.uri)
-        return result
+        return prune_dict(result)
 
 
 class CameraOrthographic:
@@ -538,7 +563,7 @@ class CameraOrthographic:
         result["ymag"] = to_float(self.ymag)
         result["zfar"] = to_float(self.zfar)
         result["znear"] = to_float(self.znear)
-        return result
+        return prune_dict(result)
 
 
 class CameraPerspective:
@@ -573,7 +598,7 @@ class CameraPerspective:
         result["yfov"] = to_float(self.yfov)
         result["zfar"] = from_union([to_float, from_none], self.zfar)
         result["znear"] = to_float(self.znear)
-        return result
+        return prune_dict(result)
 
 
 class Camera:
@@ -610,7 +635,7 @@ class Camera:
         result["orthographic"] = from_union([lambda x: to_class(CameraOrthographic, x), from_none], self.orthographic)
         result["perspective"] = from_union([lambda x: to_class(CameraPerspective, x), from_none], self.perspective)
         result["type"] = from_str(self.type)
-        return result
+        return prune_dict(result)
 
 
 class Image:
@@ -647,7 +672,7 @@ class Image:
         result["mimeType"] = from_union([from_str, from_none], self.mime_type)
         result["name"] = from_union([from_str, from_none], self.name)
         result["uri"] = from_union([from_str, from_none], self.uri)
-        return result
+        return prune_dict(result)
 
 
 class TextureInfo:
@@ -683,7 +708,7 @@ class TextureInfo:
         result["extras"] = from_extra(self.extras)
         result["index"] = from_int(self.index)
         result["texCoord"] = from_union([from_int, from_none], self.tex_coord)
-        return result
+        return prune_dict(result)
 
 
 class MaterialNormalTextureInfoClass:
@@ -718,7 +743,7 @@ class MaterialNormalTextureInfoClass:
         result["index"] = from_int(self.index)
         result["scale"] = from_union([to_float, from_none], self.scale)
         result["texCoord"] = from_union([from_int, from_none], self.tex_coord)
-        return result
+        return prune_dict(result)
 
 
 class MaterialOcclusionTextureInfoClass:
@@ -753,7 +778,7 @@ class MaterialOcclusionTextureInfoClass:
         result["index"] = from_int(self.index)
         result["strength"] = from_union([to_float, from_none], self.strength)
         result["texCoord"] = from_union([from_int, from_none], self.tex_coord)
-        return result
+        return prune_dict(result)
 
 
 class MaterialPBRMetallicRoughness:
@@ -801,7 +826,7 @@ class MaterialPBRMetallicRoughness:
         result["metallicRoughnessTexture"] = from_union([lambda x: to_class(TextureInfo, x), from_none],
                                                         self.metallic_roughness_texture)
         result["roughnessFactor"] = from_union([to_float, from_none], self.roughness_factor)
-        return result
+        return prune_dict(result)
 
 
 class Material:
@@ -858,7 +883,7 @@ class Material:
                                                 self.occlusion_texture)
         result["pbrMetallicRoughness"] = from_union([lambda x: to_class(MaterialPBRMetallicRoughness, x), from_none],
                                                     self.pbr_metallic_roughness)
-        return result
+        return prune_dict(result)
 
 
 class MeshPrimitive:
@@ -897,7 +922,7 @@ class MeshPrimitive:
         result["mode"] = from_union([from_int, from_none], self.mode)
         result["targets"] = from_union([lambda x: from_list(lambda x: from_dict(from_int, x), x), from_none],
                                        self.targets)
-        return result
+        return prune_dict(result)
 
 
 class Mesh:
@@ -931,7 +956,7 @@ class Mesh:
         result["name"] = from_union([from_str, from_none], self.name)
         result["primitives"] = from_list(lambda x: to_class(MeshPrimitive, x), self.primitives)
         result["weights"] = from_union([lambda x: from_list(to_float, x), from_none], self.weights)
-        return result
+        return prune_dict(result)
 
 
 class Node:
@@ -994,7 +1019,7 @@ class Node:
         result["skin"] = from_union([from_int, from_none], self.skin)
         result["translation"] = from_union([lambda x: from_list(to_float, x), from_none], self.translation)
         result["weights"] = from_union([lambda x: from_list(to_float, x), from_none], self.weights)
-        return result
+        return prune_dict(result)
 
 
 class Sampler:
@@ -1032,7 +1057,7 @@ class Sampler:
         result["name"] = from_union([from_str, from_none], self.name)
         result["wrapS"] = from_union([from_int, from_none], self.wrap_s)
         result["wrapT"] = from_union([from_int, from_none], self.wrap_t)
-        return result
+        return prune_dict(result)
 
 
 class Scene:
@@ -1061,7 +1086,7 @@ class Scene:
         result["extras"] = from_extra(self.extras)
         result["name"] = from_union([from_str, from_none], self.name)
         result["nodes"] = from_union([lambda x: from_list(from_int, x), from_none], self.nodes)
-        return result
+        return prune_dict(result)
 
 
 class Skin:
@@ -1096,7 +1121,7 @@ class Skin:
         result["joints"] = from_list(from_int, self.joints)
         result["name"] = from_union([from_str, from_none], self.name)
         result["skeleton"] = from_union([from_int, from_none], self.skeleton)
-        return result
+        return prune_dict(result)
 
 
 class Texture:
@@ -1128,7 +1153,7 @@ class Texture:
         result["name"] = from_union([from_str, from_none], self.name)
         result["sampler"] = from_union([from_int, from_none], self.sampler)
         result["source"] = from_union([from_int, from_none], self.source)
-        return result
+        return prune_dict(result)
 
 
 class Gltf:
@@ -1211,7 +1236,7 @@ class Gltf:
         result["skins"] = from_union([lambda x: from_list(lambda x: to_class(Skin, x), x), from_none], self.skins)
         result["textures"] = from_union([lambda x: from_list(lambda x: to_class(Texture, x), x), from_none],
                                         self.textures)
-        return result
+        return prune_dict(result)
 
 
 def gltf_from_dict(s):
@@ -31,6 +31,10 @@ g_profile_start = 0.0
 g_profile_end = 0.0
 g_profile_delta = 0.0
 
+# Progress bar updates force a UI redraw: limit them to 60 per second
+PROGRESS_UPDATE_INTERVAL = 1.0 / 60.0
+g_last_progress_update = 0.0
+
 #
 # Functions
 #
@@ -57,6 +61,22 @@ def print_console(level, output):
     print(get_timestamp() + " | " + level + ': ' + output)
 
 
+def progress_update(window_manager, value, force=False):
+    """
+    Update the Blender progress bar, skipping updates that come too soon after the previous one.
+
+    Use force for values that must always be displayed, such as the first and last ones.
+    """
+    global g_last_progress_update
+
+    now = time.monotonic()
+    if not force and now - g_last_progress_update < PROGRESS_UPDATE_INTERVAL:
+        return
+
+    window_manager.progress_update(value)
+    g_last_progress_update = now
+
+
 def print_newline():
     """Print a new line to Blender console."""
     print()
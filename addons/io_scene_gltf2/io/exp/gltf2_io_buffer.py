@@ -22,21 +22,29 @@ class Buffer:
     """Class representing binary data for use in a glTF file as 'buffer' property."""
 
     def __init__(self, buffer_index=0, initial_data=None):
-        self.__data = bytearray(b"")
+        # Data of buffer views are kept as separate chunks, and only concatenated when really needed,
+        # to avoid copying the whole buffer each time it grows
+        self.__chunks = []
+        self.__byte_length = 0
         if initial_data is not None:
-            self.__data = bytearray(initial_data.tobytes())
+            self.__append(initial_data.tobytes())
         self.__buffer_index = buffer_index
 
+    def __append(self, data):
+        self.__chunks.append(data)
+        self.__byte_length += len(data)
+
     def add_and_get_view(self, binary_data: gltf2_io_binary_data.BinaryData) -> gltf2_io.BufferView:
         """Add binary data to the buffer. Return a glTF BufferView."""
-        offset = len(self.__data)
-        self.__data.extend(binary_data.data)
+        offset = self.__byte_length
+        self.__append(binary_data.data)
 
         length = binary_data.byte_length
 
         # offsets should be a multiple of 4 --> therefore add padding if necessary
         padding = (4 - (length % 4)) % 4
-        self.__data.extend(b"\x00" * padding)
+        if padding > 0:
+            self.__append(b"\x00" * padding)
 
         buffer_view = gltf2_io.BufferView(
             buffer=self.__buffer_index,
@@ -52,13 +60,18 @@ class Buffer:
 
     @property
     def byte_length(self):
-        return len(self.__data)
+        return self.__byte_length
 
     def to_bytes(self):
-        return self.__data
+        return b"".join(self.__chunks)
+
+    def to_chunks(self):
+        """Return the buffer data as a list of bytes objects, to be written one after the other."""
+        return list(self.__chunks)
 
     def to_embed_string(self):
-        return 'data:application/octet-stream;base64,' + base64.b64encode(self.__data).decode('ascii')
+        return 'data:application/octet-stream;base64,' + base64.b64encode(self.to_bytes()).decode('ascii')
 
     def clear(self):
-        self.__data = b""
+        self.__chunks = []
+        self.__byte_length = 0
@@ -20,6 +20,12 @@ import json
 import struct
 from ...io.exp.gltf2_io_user_extensions import export_user_extensions
 
+# orjson is not shipped with Blender, but is much faster than the json module when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 #
 # Globals
 #
@@ -31,6 +37,11 @@ from collections import OrderedDict
 
 
 def save_gltf(gltf, export_settings, encoder, glb_buffer):
+    """
+    Write the glTF JSON, and for GLB files the binary buffer too.
+
+    glb_buffer is only used for GLB files: it is a bytes-like object or a list of bytes-like chunks, or None.
+    """
     # Use a class here, to be able to pass data by reference to hook (to be able to change them inside hook)
     class GlTF_format:
         def __init__(self, indent, separators):
@@ -70,14 +81,14 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
     export_user_extensions('gather_gltf_encoded_hook', export_settings, gltf_format, sort_order)
 
     gltf_ordered = OrderedDict(sorted(gltf.items(), key=lambda item: sort_order.index(item[0])))
-    gltf_encoded = json.dumps(gltf_ordered, indent=gltf_format.indent, separators=gltf_format.separators, cls=encoder, allow_nan=False)
+    gltf_data = __encode_json(gltf_ordered, gltf_format, encoder)
 
     #
 
     if export_settings['gltf_format'] != 'GLB':
-        file = open(export_settings['gltf_filepath'], "w", encoding="utf8", newline="\n")
-        file.write(gltf_encoded)
-        file.write("\n")
+        file = open(export_settings['gltf_filepath'], "wb")
+        file.write(gltf_data)
+        file.write(b"\n")
         file.close()
 
         binary = export_settings['gltf_binary']
@@ -87,41 +98,77 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
             file.close()
 
     else:
-        file = open(export_settings['gltf_filepath'], "wb")
-
-        gltf_data = gltf_encoded.encode()
-        binary = glb_buffer
-
-        length_gltf = len(gltf_data)
-        spaces_gltf = (4 - (length_gltf & 3)) & 3
-        length_gltf += spaces_gltf
-
-        length_bin = len(binary)
-        zeros_bin = (4 - (length_bin & 3)) & 3
-        length_bin += zeros_bin
+        with open(export_settings['gltf_filepath'], "wb") as file:
+            __write_glb(file, gltf_data, glb_buffer)
 
-        length = 12 + 8 + length_gltf
-        if length_bin > 0:
-            length += 8 + length_bin
-
-        # Header (Version 2)
-        file.write('glTF'.encode())
-        file.write(struct.pack("I", 2))
-        file.write(struct.pack("I", length))
-
-        # Chunk 0 (JSON)
-        file.write(struct.pack("I", length_gltf))
-        file.write('JSON'.encode())
-        file.write(gltf_data)
-        file.write(b' ' * spaces_gltf)
-
-        # Chunk 1 (BIN)
-        if length_bin > 0:
-            file.write(struct.pack("I", length_bin))
-            file.write('BIN\0'.encode())
-            file.write(binary)
-            file.write(b'\0' * zeros_bin)
+    return True
 
-        file.close()
 
-    return True
+def __write_glb(file, gltf_data, binary):
+    """
+    Write the GLB container, streaming each chunk to the file without concatenating them.
+
+    binary is either a bytes-like object, or a list of bytes-like objects that are written one after the other.
+    """
+    if binary is None:
+        binary = []
+    elif isinstance(binary, (bytes, bytearray, memoryview)):
+        binary = [binary]
+
+    length_gltf = len(gltf_data)
+    spaces_gltf = (4 - (length_gltf & 3)) & 3
+    length_gltf += spaces_gltf
+
+    length_bin = sum(len(b) for b in binary)
+    zeros_bin = (4 - (length_bin & 3)) & 3
+    length_bin += zeros_bin
+
+    length = 12 + 8 + length_gltf
+    if length_bin > 0:
+        length += 8 + length_bin
+
+    # Header (Version 2)
+    file.write(struct.pack("<4sII", b'glTF', 2, length))
+
+    # Chunk 0 (JSON)
+    file.write(struct.pack("<I4s", length_gltf, b'JSON'))
+    file.write(gltf_data)
+    file.write(b' ' * spaces_gltf)
+
+    # Chunk 1 (BIN)
+    if length_bin > 0:
+        file.write(struct.pack("<I4s", length_bin, b'BIN\0'))
+        for b in binary:
+            file.write(b)
+        file.write(b'\0' * zeros_bin)
+
+
+def __encode_json(gltf, gltf_format, encoder):
+    """Encode the glTF JSON to UTF-8 bytes."""
+    # orjson only produces compact output, or indents with 2 spaces: use it only for compact output
+    if orjson is not None and gltf_format.indent is None and tuple(gltf_format.separators) == (',', ':'):
+        # No orjson options: anything orjson would accept beyond what json accepts (numpy values, non str keys...)
+        # would make the result depend on whether orjson is installed
+        try:
+            gltf_data = orjson.dumps(gltf, default=encoder().default)
+        except orjson.JSONEncodeError:
+            # e.g. integers out of 64 bits range, or int dict keys: let json module encode (or reject) them
+            gltf_data = None
+        # orjson writes NaN and Infinity as null, without error, where json module raises on them.
+        # The exported json only has None values in extras, so null is rare: when found, json is encoded
+        # again with json module. This is expected for extras with None values, or strings containing "null",
+        # and only costs the time of the json module encoding.
+        if gltf_data is not None and b'null' not in gltf_data:
+            return gltf_data
+
+    # json.dumps (one shot) is used rather than json.dump to a text file: dump does not use the C encoder,
+    # and writes many small chunks through the text codec.
+    # ensure_ascii escapes non ASCII characters, so the result can be encoded as ASCII directly.
+    gltf_encoded = json.dumps(
+        gltf,
+        indent=gltf_format.indent,
+        separators=gltf_format.separators,
+        cls=encoder,
+        allow_nan=False,
+        ensure_ascii=True)
+    return gltf_encoded.encode('ascii')